@@ -7,9 +7,10 @@ from __future__ import annotations
 
 import ctypes
 import logging
+import re
 import threading
 from ctypes import wintypes
-from typing import Optional
+from typing import Optional, Tuple
 
 kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
 
@@ -67,6 +68,10 @@ GetConsoleScreenBufferInfo.restype = wintypes.BOOL
 STD_OUTPUT_HANDLE = wintypes.DWORD(-11)
 INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
 
+# Captures between forced window-geometry refreshes while the screen is unchanged.
+# Bounds how long a window scroll that the probe row misses can go unnoticed.
+WINDOW_REFRESH_TICKS = 5
+
 logger = logging.getLogger(__name__)
 
 
@@ -74,16 +79,35 @@ class ConsoleManager:
     """Attach to the Warsim console process and read its visible buffer."""
 
     def __init__(self) -> None:
-        self._lock = threading.RLock()  # instead of Lock()
+        self._lock = threading.Lock()  # not re-entrant: locked helpers must not nest
         self._pid: Optional[int] = None
         self._stdout = wintypes.HANDLE(INVALID_HANDLE_VALUE)
+        # Cached (width, height, top, probe) of the visible window and captures since it was queried
+        self._window: Optional[Tuple[int, int, int, int]] = None
+        self._window_age = 0
+        self._last_text: Optional[str] = None
+        # Raw row just below the window at the last capture; see capture_buffer
+        self._last_below = ""
+        # Read buffer reused across captures; only reallocated when the window grows
+        self._scratch_buf: Optional[ctypes.Array[ctypes.c_wchar]] = None
+        self._scratch_size = 0
+        # ReadConsoleOutputCharacterW out-param and origin, allocated once and refilled per read
+        self._read_count = wintypes.DWORD()
+        self._read_count_ref = ctypes.byref(self._read_count)
+        self._read_origin = COORD(0, 0)
+        # Row splitter for the current console width, rebuilt only when the width changes
+        self._row_re: Optional[re.Pattern[str]] = None
+        self._row_width = 0
+        # Row slices of a complete width × height read, rebuilt only when the window resizes
+        self._grid: Tuple[slice, ...] = ()
+        self._grid_shape = (0, 0)
 
     # Attachment helpers
     def attach(self, pid: int) -> None:
         with self._lock:
             if self._pid == pid:
                 return
-            self.detach()  # Ensures we release any previous console
+            self._detach_locked()  # Ensures we release any previous console
             if not AttachConsole(pid):
                 err = ctypes.get_last_error()
                 logger.error("Attach: AttachConsole failed with error code %d", err)
@@ -94,24 +118,30 @@ class ConsoleManager:
                 err = ctypes.get_last_error()
                 logger.error("Attach: GetStdHandle failed with error code %d", err)
                 # Detach console if GetStdHandle fails after successful attach
-                self.detach()
+                self._detach_locked()
                 raise OSError(err, "GetStdHandle returned INVALID_HANDLE_VALUE")
 
     def detach(self) -> None:
         with self._lock:
-            if self._pid is None:
-                return
-            # Store pid before clearing it for logging
-            pid_to_log = self._pid
-            self._pid = None
-            self._stdout = wintypes.HANDLE(INVALID_HANDLE_VALUE)
-            if not FreeConsole():
-                err = ctypes.get_last_error()
-                # Log warning instead of raising error during cleanup
-                logger.warning(
-                    "Detach: FreeConsole failed during detach (PID=%d, err=%d)",
-                    pid_to_log, err
-                )
+            self._detach_locked()
+
+    def _detach_locked(self) -> None:
+        """Release the attached console; caller must hold ``self._lock``."""
+        if self._pid is None:
+            return
+        # Store pid before clearing it for logging
+        pid_to_log = self._pid
+        self._pid = None
+        self._stdout = wintypes.HANDLE(INVALID_HANDLE_VALUE)
+        self._window = None
+        self._last_text = None
+        if not FreeConsole():
+            err = ctypes.get_last_error()
+            # Log warning instead of raising error during cleanup
+            logger.warning(
+                "Detach: FreeConsole failed during detach (PID=%d, err=%d)",
+                pid_to_log, err
+            )
 
     # Public API
     def capture_buffer(self) -> str:
@@ -120,42 +150,96 @@ class ConsoleManager:
             if self._pid is None:
                 raise RuntimeError("Not attached to any console")
 
-            csbi = CONSOLE_SCREEN_BUFFER_INFO()
-            if not GetConsoleScreenBufferInfo(self._stdout, ctypes.byref(csbi)):
-                err = ctypes.get_last_error()
-                logger.error(
-                    "Capture Buffer: GetConsoleScreenBufferInfo failed (err=%d)",
-                    err
-                )
-                raise OSError(
-                    ctypes.get_last_error(),
-                    "GetConsoleScreenBufferInfo failed"
-                )
-
-            width = csbi.srWindow.Right - csbi.srWindow.Left + 1
-            height = csbi.srWindow.Bottom - csbi.srWindow.Top + 1
-            size = width * height
-
-            buf = ctypes.create_unicode_buffer(size)
-            read = wintypes.DWORD()
-            origin = COORD(0, csbi.srWindow.Top)
-            if not ReadConsoleOutputCharacterW(
-                self._stdout, buf, size, origin, ctypes.byref(read)
-            ):
-                err = ctypes.get_last_error()
-                logger.error(
-                    "Capture Buffer: ReadConsoleOutputCharacterW failed (err=%d)",
-                    err
-                )
-                raise OSError(
-                    ctypes.get_last_error(),
-                    "ReadConsoleOutputCharacterW failed"
-                )
-
-            view = buf[:read.value]
-            return "\n".join(
-                view[i:i + width].rstrip() for i in range(0, len(view), width)
+            if self._window is None or self._window_age >= WINDOW_REFRESH_TICKS:
+                self._window = self._query_window()
+                self._window_age = 0
+            self._window_age += 1
+
+            text, below = self._read_window(*self._window)
+            # New screen: the window may have moved or resized with it, so confirm the
+            # geometry before handing the text out. Output printed below the window makes
+            # conhost scroll it while the cached rows stay the same, so a change in the
+            # row just below the window triggers the same check.
+            if text != self._last_text or below != self._last_below:
+                window = self._query_window()
+                if window != self._window:
+                    self._window = window
+                    text, below = self._read_window(*window)
+                self._window_age = 1
+                self._last_text, self._last_below = text, below
+            return text
+
+    def _query_window(self) -> Tuple[int, int, int, int]:
+        """Return ``(width, height, top, probe)`` of the visible console window.
+
+        *probe* is 1 when the screen buffer has a row below the window to watch, else 0.
+        """
+        csbi = CONSOLE_SCREEN_BUFFER_INFO()
+        if not GetConsoleScreenBufferInfo(self._stdout, ctypes.byref(csbi)):
+            err = ctypes.get_last_error()
+            logger.error(
+                "Capture Buffer: GetConsoleScreenBufferInfo failed (err=%d)",
+                err
+            )
+            raise OSError(
+                err,
+                "GetConsoleScreenBufferInfo failed"
+            )
+        win = csbi.srWindow
+        probe = 1 if win.Bottom + 1 < csbi.dwSize.Y else 0
+        return win.Right - win.Left + 1, win.Bottom - win.Top + 1, win.Top, probe
+
+    def _read_window(self, width: int, height: int, top: int, probe: int) -> Tuple[str, str]:
+        """Read the *width* × *height* cells starting at row *top*.
+
+        Returns the window as stripped lines plus the raw text of the *probe* rows
+        read below it ("" when there are none).
+        """
+        cells = width * height
+        size = cells + width * probe
+
+        if size > self._scratch_size:
+            self._scratch_buf = ctypes.create_unicode_buffer(size)
+            self._scratch_size = size
+        buf = self._scratch_buf
+        read = self._read_count
+        self._read_origin.Y = top
+        if not ReadConsoleOutputCharacterW(
+            self._stdout, buf, size, self._read_origin, self._read_count_ref
+        ):
+            err = ctypes.get_last_error()
+            logger.error(
+                "Capture Buffer: ReadConsoleOutputCharacterW failed (err=%d)",
+                err
+            )
+            raise OSError(
+                err,
+                "ReadConsoleOutputCharacterW failed"
             )
+        if read.value == size:
+            # Complete read (the usual case): every row is exactly *width* cells
+            text = buf[:size]
+            rows = "\n".join([text[row].rstrip() for row in self._grid_slices(width, height)])
+            return rows, text[cells:]
+
+        self._window = None  # short read: the cached geometry is stale
+        # The last row may be partial; split and strip entirely in C
+        rows = self._rows(width).findall(buf[:min(read.value, cells)])
+        return "\n".join(map(str.rstrip, rows)), ""
+
+    def _grid_slices(self, width: int, height: int) -> Tuple[slice, ...]:
+        """Return one slice per row of a flat *width* × *height* buffer."""
+        if self._grid_shape != (width, height):
+            self._grid = tuple(slice(i, i + width) for i in range(0, width * height, width))
+            self._grid_shape = (width, height)
+        return self._grid
+
+    def _rows(self, width: int) -> re.Pattern[str]:
+        """Return a pattern whose ``findall`` chops a flat buffer into *width*‑wide rows."""
+        if self._row_width != width:
+            self._row_re = re.compile(f".{{1,{width}}}", re.S)
+            self._row_width = width
+        return self._row_re  # type: ignore[return-value]
 
     # Context-manager helpers
     def __enter__(self):
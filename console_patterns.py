@@ -1,12 +1,32 @@
 import re
 
-MAIN_MENU_RE     = re.compile(r"Welcome to Warsim.*?1\) Start a New Game", re.S)
-LOAD_MENU_RE     = re.compile(r"Savegames.*enter the name of the save file", re.I | re.S)
-PRESS_ANY_KEY_RE = re.compile(r"Press any key to continue", re.I)
-KINGDOM_MENU_RE  = re.compile(r"KINGDOM MENU", re.I)
-# Pattern to detect the screen shown when auto-recruit is OFF
-AUTORECRUIT_SETUP_PROMPT_RE = re.compile(r"automate the automation for me!", re.I | re.S)
-# Pattern to detect the screen shown when auto-recruit is ON
-AUTORECRUIT_ALREADY_ON_RE = re.compile(r"already recruiting automatically", re.I | re.S)
-# Pattern to detect the start of an arena fight (e.g., "  Knight vs. Bandit")
-ARENA_FIGHT_START_RE = re.compile(r"^\s+\S+\s+vs\.\s+\S+", re.I)
\ No newline at end of file
+# Everything here is casefolded: check it against ``buf.casefold()``, never the raw buffer.
+
+# Spans between the two halves of a multi-part prompt are unbounded: a long save
+# list on a large window can put any distance between them.  They only run once
+# their hint below is on screen, and a miss costs one forward scan per occurrence
+# of the opening literal – one per screen in practice.
+# Console text is padded with plain spaces, so re.ASCII classes match the same
+# cells without the Unicode tables.
+MAIN_MENU_RE     = re.compile(r"welcome to warsim[\s\S]*?1\) start a new game", re.ASCII)
+LOAD_MENU_RE     = re.compile(r"savegames[\s\S]*?enter the name of the save file", re.ASCII)
+# Pattern to detect the start of an arena fight (e.g., "  Knight vs. Bandit"); anchored, use .match
+ARENA_FIGHT_START_RE = re.compile(r"\s+\S+\s+vs\.\s+\S+", re.ASCII)
+
+# Literals that must be present for the matching pattern above to hit.
+# Checked first so most ticks never reach the regex engine.
+MAIN_MENU_HINT     = "welcome to warsim"
+LOAD_MENU_HINT     = "enter the name of the save file"
+ARENA_FIGHT_START_HINT = "vs."
+
+# Plain-text prompts: the substring test is the whole check
+PRESS_ANY_KEY_HINT = "press any key to continue"
+KINGDOM_MENU_HINT  = "kingdom menu"
+# Screen shown when auto-recruit is OFF
+AUTORECRUIT_SETUP_PROMPT_HINT = "automate the automation for me!"
+# Screen shown when auto-recruit is ON
+AUTORECRUIT_ALREADY_ON_HINT   = "already recruiting automatically"
+CROWNING_CEREMONY_HINT = "crowning ceremony"
+OLD_CROLL_HINT         = "old croll"
+SAVE_GAME_HINT         = "save game"
+SAVE_NAME_HINT         = "save name"
@@ -4,9 +4,10 @@ Automation agent – BootTask + reusable SaveTask (refactored).
 This refactor focuses on three goals:
 1. **Readability** – pull magic numbers / sleeps into clearly named helpers, trim deeply‑nested
    conditionals, and add fine‑grained logging where useful.
-2. **Consistency** – all outbound inputs now flow through the same helper which enforces a
-   short, configurable delay (`INPUT_DELAY`) after every keystroke.  This guarantees that
-   menus never receive bursts that risk being dropped.
+2. **Consistency** – all outbound inputs now flow through the same helpers which enforce a
+   short, configurable gap (`INPUT_DELAY`) between consecutive inputs, sleeping only for
+   what is left of it.  This guarantees that menus never receive bursts that risk being
+   dropped – fixed menu paths included.
 3. **Non‑functional parity** – the public interface (class names, external imports, etc.) is
    unchanged so the rest of the project can import `CoreAgent` exactly as before.
 """
@@ -15,44 +16,96 @@ from __future__ import annotations
 import logging
 import queue
 import time
-from enum import Enum, auto
-from typing import Callable, List
+from enum import Enum, IntEnum
+from typing import Callable, ClassVar, Dict, Iterable, List, Optional
 
-from input_manager import send_key, send_number, send_text
+from input_manager import send_key, send_number, send_number_sequence, send_text
 from memory_manager import MemoryManager
 import console_patterns as pat
 
 logger = logging.getLogger(__name__)
 
 # ───────────────────────────── Constants ──────────────────────────────
-INPUT_DELAY = 0.10  # seconds – single source of truth for post‑key pause
+INPUT_DELAY = 0.10  # seconds – single source of truth for the minimum gap between inputs
+
+_last_input_ts = 0.0  # perf_counter() when the previous input finished sending
 
 # Convenience wrappers that **always** respect INPUT_DELAY
 
+def _await_input_gap() -> None:
+    """Sleep only for whatever is left of INPUT_DELAY since the previous input."""
+    wait = INPUT_DELAY - (time.perf_counter() - _last_input_ts)
+    if wait > 0:
+        time.sleep(wait)
+
+
+def _mark_input() -> None:
+    global _last_input_ts
+    _last_input_ts = time.perf_counter()
+
+
 def _send_number(n: int) -> None:  # noqa: D401  (imperative helper)
-    """Send a menu number followed by *Enter* with standard delay."""
+    """Send a menu number followed by *Enter*, keeping the standard gap."""
+    _await_input_gap()
     send_number(n)
-    time.sleep(INPUT_DELAY)
+    _mark_input()
+
+
+def _send_number_sequence(numbers: Iterable[int]) -> None:
+    """Send several menu numbers (each with *Enter*), keeping the standard gap between them."""
+    # Not verified that Warsim keeps selections queued ahead of the next menu, so each
+    # step still waits out INPUT_DELAY instead of going out as one burst
+    _await_input_gap()
+    send_number_sequence(numbers, INPUT_DELAY)
+    _mark_input()
 
 
 def _send_text(text: str, *, enter: bool = True) -> None:
-    """Send arbitrary text and optionally append *Enter* with standard delay."""
+    """Send arbitrary text and optionally append *Enter*, keeping the standard gap."""
+    _await_input_gap()
     send_text(text, enter)
-    time.sleep(INPUT_DELAY)
+    _mark_input()
 
 
 def _send_key(ch: str = " ") -> None:
-    """Send a single key (default <space>) with standard delay."""
+    """Send a single key (default <space>), keeping the standard gap."""
+    _await_input_gap()
     send_key(ch)
-    time.sleep(INPUT_DELAY)
+    _mark_input()
+
+
+# ─────────────────────────── _TickLog ─────────────────────────────────
+class _TickLog:
+    """Stand‑in for ``gen_q`` that collects one tick's messages and forwards them in a single put."""
+
+    __slots__ = ("_q", "_msgs")
+
+    def __init__(self, q: queue.Queue) -> None:
+        self._q = q
+        self._msgs: List[str] = []
+
+    def put(self, msg: str) -> None:
+        self._msgs.append(msg)
+
+    def flush(self) -> None:
+        """Post everything collected since the last flush as one newline‑joined message."""
+        if self._msgs:
+            self._q.put("\n".join(self._msgs))
+            self._msgs.clear()
 
 
 # ─────────────────────────── AgentContext ─────────────────────────────
 class AgentContext:
     """Holds shared state information used by various Tasks."""
 
+    __slots__ = (
+        "save_name", "save_name_low", "loaded_save", "in_kingdom_menu", "needs_save", "in_arena_fight",
+        "intro_origin_text", "intro_conditions_text",
+    )
+
     def __init__(self, save_name: str = "LLMSave") -> None:
         self.save_name = save_name
+        self.save_name_low = save_name.casefold()  # for matching against casefolded frames
         self.loaded_save: bool = False
         self.in_kingdom_menu: bool = False
         self.needs_save: bool = False
@@ -63,53 +116,85 @@ class AgentContext:
 
 
 # ───────────────────────────── Task Base ──────────────────────────────
-class TaskState(Enum):
-    ACTIVE = auto()
-    DONE = auto()
-    WAITING = auto() # Add a WAITING state for tasks like Arena
+class TaskState(IntEnum):
+    ACTIVE = 0
+    DONE = 1
+    WAITING = 2 # Add a WAITING state for tasks like Arena
 
 
 class Task:  # pylint: disable=too-few-public-methods
     """Abstract base‑class for all tasks."""
 
-    def __init__(self, ctx: AgentContext, mem: MemoryManager, gen_q: queue.Queue):
+    # Read on every tick – slots keep attribute access off the instance dict.
+    # ``s`` is each sub‑class's own state‑machine position.
+    __slots__ = ("ctx", "mem", "gen_q", "state", "s")
+
+    # Casefolded text each sub‑state waits for; states without an entry see every frame
+    _TRIGGERS: ClassVar[Dict[Enum, str]] = {}
+
+    def __init__(self, ctx: AgentContext, mem: MemoryManager, gen_q: queue.Queue | _TickLog):
         self.ctx, self.mem, self.gen_q = ctx, mem, gen_q
         self.state = TaskState.ACTIVE # Default state
 
-    # Sub‑classes must implement
-    def feed(self, txt: str) -> None:  # noqa: D401 we are *not* a property
+    # Sub‑classes must implement; *low* is ``txt.casefold()``, computed once per tick
+    def feed(self, txt: str, low: str) -> None:  # noqa: D401 we are *not* a property
         raise NotImplementedError
 
+    def trigger(self) -> Optional[str]:
+        """Return text that must be in the casefolded frame for :meth:`feed` to act, if any."""
+        return self._TRIGGERS.get(self.s)  # type: ignore[attr-defined]
+
+    @property
+    def needs_retick(self) -> bool:
+        """True while the task must be fed again even if the next frame is unchanged."""
+        return False
+
     # Optional reset for tasks that can run multiple times
     def reset(self) -> None:
         pass
 
 
 # ───────────────────────────── BootTask ───────────────────────────────
-class BootState(Enum):
-    START = auto()
-    LOAD_MENU = auto()
-    HANDLE_LOAD_EXIT_ERROR = auto()
-    WAIT_FOR_MAIN_MENU_AFTER_ERROR = auto()
-    ORIGIN = auto()
-    CAPTURE_CONDITIONS = auto()
-    SKIP_CEREMONY = auto()
-    SKIP_CROLL = auto()
-    SKIP_WAIT = auto()
-    READY = auto()
-    CHECK_AUTORECRUIT = auto()
+class BootState(IntEnum):
+    START = 0
+    LOAD_MENU = 1
+    HANDLE_LOAD_EXIT_ERROR = 2
+    WAIT_FOR_MAIN_MENU_AFTER_ERROR = 3
+    ORIGIN = 4
+    CAPTURE_CONDITIONS = 5
+    SKIP_CEREMONY = 6
+    SKIP_CROLL = 7
+    SKIP_WAIT = 8
+    READY = 9
+    CHECK_AUTORECRUIT = 10
 
 
 class BootTask(Task):
     """Completes the initial boot / menu navigation until the kingdom menu is live."""
 
-    def __init__(self, ctx: AgentContext, mem: MemoryManager, gen_q: queue.Queue):
+    __slots__ = ("_handlers",)
+
+    # CHECK_AUTORECRUIT has a fallback for unknown screens, so it has no trigger
+    _TRIGGERS = {
+        BootState.START: pat.MAIN_MENU_HINT,
+        BootState.LOAD_MENU: pat.LOAD_MENU_HINT,
+        BootState.HANDLE_LOAD_EXIT_ERROR: pat.PRESS_ANY_KEY_HINT,
+        BootState.WAIT_FOR_MAIN_MENU_AFTER_ERROR: pat.MAIN_MENU_HINT,
+        BootState.ORIGIN: pat.PRESS_ANY_KEY_HINT,
+        BootState.CAPTURE_CONDITIONS: pat.PRESS_ANY_KEY_HINT,
+        BootState.SKIP_CEREMONY: pat.CROWNING_CEREMONY_HINT,
+        BootState.SKIP_CROLL: pat.OLD_CROLL_HINT,
+        BootState.SKIP_WAIT: pat.PRESS_ANY_KEY_HINT,
+        BootState.READY: pat.KINGDOM_MENU_HINT,
+    }
+
+    def __init__(self, ctx: AgentContext, mem: MemoryManager, gen_q: queue.Queue | _TickLog):
         super().__init__(ctx, mem, gen_q)
         self.s = BootState.START
         self.gen_q.put("TASK: Boot – Starting boot sequence…")
 
         # Map *every* BootState to an explicit handler for clarity
-        self._handlers: dict[BootState, Callable[[str], None]] = {
+        handlers: dict[BootState, Callable[[str, str], None]] = {
             BootState.START: self._h_start,
             BootState.LOAD_MENU: self._h_load_menu,
             BootState.HANDLE_LOAD_EXIT_ERROR: self._h_handle_load_exit_error,
@@ -122,23 +207,27 @@ class BootTask(Task):
             BootState.READY: self._h_ready,
             BootState.CHECK_AUTORECRUIT: self._h_check_autorecruit,
         }
+        # ...then flatten it into declaration order so feed() indexes instead of hashing
+        self._handlers: tuple[Callable[[str, str], None], ...] = tuple(
+            handlers[state] for state in BootState
+        )
 
     # ── public interface ──
-    def feed(self, txt: str) -> None:  # noqa: D401 – not a property
+    def feed(self, txt: str, low: str) -> None:  # noqa: D401 – not a property
         if self.state is TaskState.DONE:
             return
-        self._handlers[self.s](txt)  # type: ignore[index]
+        self._handlers[self.s](txt, low)  # states are numbered from 0 in definition order
 
     # ── handlers ──
-    def _h_start(self, txt: str) -> None:
-        if pat.MAIN_MENU_RE.search(txt):
+    def _h_start(self, txt: str, low: str) -> None:
+        if pat.MAIN_MENU_HINT in low and pat.MAIN_MENU_RE.search(low):
             _send_number(2)
             self.s = BootState.LOAD_MENU
 
-    def _h_load_menu(self, txt: str) -> None:
-        if not pat.LOAD_MENU_RE.search(txt):
+    def _h_load_menu(self, txt: str, low: str) -> None:
+        if pat.LOAD_MENU_HINT not in low or not pat.LOAD_MENU_RE.search(low):
             return
-        if self.ctx.save_name.lower() in txt.lower():
+        if self.ctx.save_name_low in low:
             self.gen_q.put(f"TASK: Boot – Found save '{self.ctx.save_name}'. Loading…")
             _send_text(self.ctx.save_name)
             self.ctx.loaded_save = True
@@ -151,8 +240,8 @@ class BootTask(Task):
             # time.sleep(0.2)             # OLD
             # _send_number(3)             # OLD: Quick‑start
 
-            # Use imported functions directly, managing delays explicitly
-            send_text("x", append_enter=True) # Send Enter after 'x'
+            # Paced like every other input: _send_text waits out what is left of INPUT_DELAY
+            _send_text("x")  # Send Enter after 'x'
             # time.sleep(1.0) # Keep delay to allow menu transition -- No longer needed, state machine handles timing
 
             # logger.debug("BootTask: Sending '3' + Enter for Quick-start...")
@@ -164,68 +253,66 @@ class BootTask(Task):
             # self.s = BootState.ORIGIN # Transition to error handling instead
             self.s = BootState.HANDLE_LOAD_EXIT_ERROR
 
-    def _h_handle_load_exit_error(self, txt: str) -> None:
+    def _h_handle_load_exit_error(self, txt: str, low: str) -> None:
         """Handles the 'file does not exist' error after trying to exit load menu with 'x'."""
         # Expect "... Press any key to continue ..."
-        if pat.PRESS_ANY_KEY_RE.search(txt):
+        if pat.PRESS_ANY_KEY_HINT in low:
             _send_key() # Send spacebar (or any key)
             self.s = BootState.WAIT_FOR_MAIN_MENU_AFTER_ERROR
         else:
             pass # logger.debug("BootTask: Waiting for 'Press any key' prompt in HANDLE_LOAD_EXIT_ERROR.")
 
-    def _h_wait_for_main_menu_after_error(self, txt: str) -> None:
+    def _h_wait_for_main_menu_after_error(self, txt: str, low: str) -> None:
         """Waits for the main menu to reappear after dismissing the load error."""
-        if pat.MAIN_MENU_RE.search(txt):
+        if pat.MAIN_MENU_HINT in low and pat.MAIN_MENU_RE.search(low):
             _send_number(3) # Send Quick-start command
             self.mem.add_event("Quick‑start (no save)") # Add event now
             self.s = BootState.ORIGIN # Proceed to new game narrative capture
         else:
              pass # logger.debug("BootTask: Waiting for Main Menu in WAIT_FOR_MAIN_MENU_AFTER_ERROR.")
 
-    def _h_origin(self, txt: str) -> None:
-        if pat.PRESS_ANY_KEY_RE.search(txt):
+    def _h_origin(self, txt: str, low: str) -> None:
+        if pat.PRESS_ANY_KEY_HINT in low:
             self.gen_q.put("TASK: Boot [New] – Capturing Origin narrative…")
             self.ctx.intro_origin_text = txt
             _send_key()
             self.s = BootState.CAPTURE_CONDITIONS
 
-    def _h_conditions(self, txt: str) -> None:
-        if pat.PRESS_ANY_KEY_RE.search(txt):
+    def _h_conditions(self, txt: str, low: str) -> None:
+        if pat.PRESS_ANY_KEY_HINT in low:
             self.gen_q.put("TASK: Boot [New] – Capturing Conditions narrative…")
             self.ctx.intro_conditions_text = txt
             _send_key()
             self.s = BootState.SKIP_CEREMONY
 
-    def _h_skip_ceremony(self, txt: str) -> None:
-        if "crowning ceremony" in txt.lower():
+    def _h_skip_ceremony(self, txt: str, low: str) -> None:
+        if pat.CROWNING_CEREMONY_HINT in low:
             _send_number(2)
             self.s = BootState.SKIP_CROLL
 
-    def _h_skip_croll(self, txt: str) -> None:
-        if "old croll" in txt.lower():
+    def _h_skip_croll(self, txt: str, low: str) -> None:
+        if pat.OLD_CROLL_HINT in low:
             _send_number(2)
             self.s = BootState.SKIP_WAIT
 
-    def _h_skip_wait(self, txt: str) -> None:
-        if pat.PRESS_ANY_KEY_RE.search(txt):
+    def _h_skip_wait(self, txt: str, low: str) -> None:
+        if pat.PRESS_ANY_KEY_HINT in low:
             _send_key()
             self.s = BootState.READY
 
-    def _h_ready(self, txt: str) -> None:
-        if not pat.KINGDOM_MENU_RE.search(txt):
+    def _h_ready(self, txt: str, low: str) -> None:
+        if not self.ctx.in_kingdom_menu:  # set by CoreAgent for this frame
             return
         if not self.ctx.loaded_save:  # New Game → enable directly
             self._enable_autorecruit_new_game()
         else:  # Loaded Game → check status
             self.gen_q.put("TASK: Boot [Load] – Checking auto‑recruit status…")
-            _send_number(1)  # Recruit menu
-            _send_number(7)  # Auto‑recruit submenu
+            _send_number_sequence((1, 7))  # Recruit menu → Auto‑recruit submenu
             self.s = BootState.CHECK_AUTORECRUIT
 
     def _enable_autorecruit_new_game(self) -> None:
         self.gen_q.put("TASK: Boot [New] – Enabling auto‑recruit…")
-        for n in (1, 7, 1, 0, 0):
-            _send_number(n)
+        _send_number_sequence((1, 7, 1, 0, 0))
         self.mem.add_event("Auto‑recruit enabled (New Game)")
         self.ctx.in_kingdom_menu = True
         # Request an initial save right after setting up auto-recruit for a new game
@@ -234,17 +321,15 @@ class BootTask(Task):
         self.state = TaskState.DONE
         self.gen_q.put("TASK: Boot [New] – Auto‑recruit enabled. Boot complete.")
 
-    def _h_check_autorecruit(self, txt: str) -> None:
+    def _h_check_autorecruit(self, txt: str, low: str) -> None:
         """Handle auto‑recruit verification for loaded saves."""
-        if pat.AUTORECRUIT_SETUP_PROMPT_RE.search(txt):
+        if pat.AUTORECRUIT_SETUP_PROMPT_HINT in low:
             self.gen_q.put("TASK: Boot [Load] – Auto‑recruit is OFF. Enabling…")
-            for n in (1, 0, 0):  # Automate → Exit → Exit
-                _send_number(n)
+            _send_number_sequence((1, 0, 0))  # Automate → Exit → Exit
             self.mem.add_event("Auto‑recruit enabled (Loaded Game)")
-        elif pat.AUTORECRUIT_ALREADY_ON_RE.search(txt):
+        elif pat.AUTORECRUIT_ALREADY_ON_HINT in low:
             self.gen_q.put("TASK: Boot [Load] – Auto‑recruit already ON.")
-            for n in (0, 0):  # Fine → Exit
-                _send_number(n)
+            _send_number_sequence((0, 0))  # Fine → Exit
             self.mem.add_event("Auto‑recruit verified ON (Loaded Game)")
         else:
             # Graceful fallback – assume we landed back at the kingdom menu
@@ -258,21 +343,44 @@ class BootTask(Task):
 
 
 # ───────────────────────────── SaveTask ────────────────────────────────
-class SaveState(Enum):
-    WAIT = auto()
-    EXTRAS = auto()
-    NAME = auto()
-    CONFIRM = auto()
+class SaveState(IntEnum):
+    WAIT = 0
+    EXTRAS = 1
+    NAME = 2
+    CONFIRM = 3
 
 
 class SaveTask(Task):
     """Invoked whenever `MemoryManager` flags that a save is needed."""
 
-    def __init__(self, ctx: AgentContext, mem: MemoryManager, gen_q: queue.Queue):
+    __slots__ = ("_handlers",)
+
+    # WAIT depends on flags rather than screen text, so it has no trigger
+    _TRIGGERS = {
+        SaveState.EXTRAS: pat.SAVE_GAME_HINT,
+        SaveState.NAME: pat.SAVE_NAME_HINT,
+        SaveState.CONFIRM: pat.PRESS_ANY_KEY_HINT,
+    }
+
+    def __init__(self, ctx: AgentContext, mem: MemoryManager, gen_q: queue.Queue | _TickLog):
         super().__init__(ctx, mem, gen_q)
         self.s = SaveState.WAIT
+        handlers: Dict[SaveState, Callable[[str, str], None]] = {
+            SaveState.WAIT: self._h_wait,
+            SaveState.EXTRAS: self._h_extras,
+            SaveState.NAME: self._h_name,
+            SaveState.CONFIRM: self._h_confirm,
+        }
+        self._handlers: tuple[Callable[[str, str], None], ...] = tuple(
+            handlers[state] for state in SaveState
+        )
+
+    def feed(self, txt: str, low: str) -> None:
+        # Idle fast path: no save requested and none in flight (needs_save stays set
+        # until CONFIRM completes), so there is nothing to sync, reactivate or match
+        if not (self.ctx.needs_save or self.mem.request_save):
+            return
 
-    def feed(self, txt: str) -> None:
         # Sync with mem flag once per cycle
         if self.mem.request_save:
             self.ctx.needs_save = True
@@ -287,24 +395,27 @@ class SaveTask(Task):
             return
 
         # Mini state‑machine
-        if self.s is SaveState.WAIT:
-            if self.ctx.needs_save and self.ctx.in_kingdom_menu:
-                self.gen_q.put("TASK: Save – Initiating save sequence…")
-                _send_number(13)  # Extras menu
-                self.s = SaveState.EXTRAS
-            return
+        self._handlers[self.s](txt, low)
 
-        if self.s is SaveState.EXTRAS and "Save Game" in txt:
+    # ── handlers ──
+    def _h_wait(self, txt: str, low: str) -> None:
+        if self.ctx.needs_save and self.ctx.in_kingdom_menu:
+            self.gen_q.put("TASK: Save – Initiating save sequence…")
+            _send_number(13)  # Extras menu
+            self.s = SaveState.EXTRAS
+
+    def _h_extras(self, txt: str, low: str) -> None:
+        if pat.SAVE_GAME_HINT in low:
             _send_number(1)
             self.s = SaveState.NAME
-            return
 
-        if self.s is SaveState.NAME and "Save Name" in txt:
+    def _h_name(self, txt: str, low: str) -> None:
+        if pat.SAVE_NAME_HINT in low:
             _send_text(self.ctx.save_name)
             self.s = SaveState.CONFIRM
-            return
 
-        if self.s is SaveState.CONFIRM and pat.PRESS_ANY_KEY_RE.search(txt):
+    def _h_confirm(self, txt: str, low: str) -> None:
+        if pat.PRESS_ANY_KEY_HINT in low:
             _send_key()
             _send_number(0)  # Exit menu
             self.mem.add_event(f"Game saved: {self.ctx.save_name}")
@@ -319,54 +430,81 @@ class SaveTask(Task):
 
 
 # ───────────────────────────── ArenaTask ──────────────────────────────
-class ArenaState(Enum):
-    WAITING_FOR_FIGHT = auto()
-    FIGHTING = auto()
-    FIGHT_OVER = auto()
+class ArenaState(IntEnum):
+    WAITING_FOR_FIGHT = 0
+    FIGHTING = 1
+    FIGHT_OVER = 2
 
 class ArenaTask(Task):
     """Automates 'press any key' during arena fights."""
 
-    def __init__(self, ctx: AgentContext, mem: MemoryManager, gen_q: queue.Queue):
+    __slots__ = ("_handlers",)
+
+    # FIGHTING reacts to either of two prompts, so it has no single trigger
+    _TRIGGERS = {ArenaState.WAITING_FOR_FIGHT: pat.ARENA_FIGHT_START_HINT}
+
+    def __init__(self, ctx: AgentContext, mem: MemoryManager, gen_q: queue.Queue | _TickLog):
         super().__init__(ctx, mem, gen_q)
         self.state = TaskState.WAITING # Start in waiting state
         self.s = ArenaState.WAITING_FOR_FIGHT
+        handlers: Dict[ArenaState, Callable[[str, str], None]] = {
+            ArenaState.WAITING_FOR_FIGHT: self._h_waiting_for_fight,
+            ArenaState.FIGHTING: self._h_fighting,
+            ArenaState.FIGHT_OVER: self._h_fight_over,
+        }
+        self._handlers: tuple[Callable[[str, str], None], ...] = tuple(
+            handlers[state] for state in ArenaState
+        )
 
-    def feed(self, txt: str) -> None:
+    def feed(self, txt: str, low: str) -> None:
         if self.state is TaskState.DONE:
             return
 
         # --- State Machine ---
-        if self.s is ArenaState.WAITING_FOR_FIGHT:
-            # Check only the first line for the fight start pattern
-            first_line = txt.split('\\n', 1)[0]
-            if pat.ARENA_FIGHT_START_RE.search(first_line):
-                self.gen_q.put("TASK: Arena – Fight detected. Taking control...")
-                self.ctx.in_arena_fight = True
-                self.state = TaskState.ACTIVE # Mark as active *during* the fight
-                self.s = ArenaState.FIGHTING
-                _send_key() # Press key to start the fight sequence
-
-        elif self.s is ArenaState.FIGHTING:
-            if pat.PRESS_ANY_KEY_RE.search(txt):
-                # Check if the kingdom menu is also present (fight ended)
-                if pat.KINGDOM_MENU_RE.search(txt):
-                    self.gen_q.put("TASK: Arena – Fight finished. Returning control.")
-                    self.ctx.in_arena_fight = False
-                    self.s = ArenaState.FIGHT_OVER
-                    self.state = TaskState.DONE # Mark as done until reset
-                    _send_key() # Final key press to dismiss the win/loss screen
-                else:
-                    # Fight still ongoing, press key to continue
-                    _send_key()
-            # If no "press any key" but kingdom menu appears, something went wrong, exit
-            elif pat.KINGDOM_MENU_RE.search(txt):
-                 self.gen_q.put("WARN: Arena – Kingdom menu detected unexpectedly during fight. Ending task.")
-                 self.ctx.in_arena_fight = False
-                 self.s = ArenaState.FIGHT_OVER
-                 self.state = TaskState.DONE # Mark as done
-
-        # FIGHT_OVER state doesn't need active handling in feed
+        self._handlers[self.s](txt, low)
+
+    # ── handlers ──
+    def _h_waiting_for_fight(self, txt: str, low: str) -> None:
+        # Check only the first non-blank row for the fight start pattern. Blank rows come
+        # back as "", so skip them; the newline just before the row still counts as the
+        # leading whitespace the pattern requires, as it did when the whole frame was matched.
+        start = len(low) - len(low.lstrip("\n"))
+        end = low.find("\n", start)
+        if pat.ARENA_FIGHT_START_RE.match(low, max(start - 1, 0), len(low) if end < 0 else end):
+            self.gen_q.put("TASK: Arena – Fight detected. Taking control...")
+            self.ctx.in_arena_fight = True
+            self.state = TaskState.ACTIVE # Mark as active *during* the fight
+            self.s = ArenaState.FIGHTING
+            _send_key() # Press key to start the fight sequence
+
+    def _h_fighting(self, txt: str, low: str) -> None:
+        in_menu = self.ctx.in_kingdom_menu  # set by CoreAgent for this frame
+        if pat.PRESS_ANY_KEY_HINT in low:
+            # Check if the kingdom menu is also present (fight ended)
+            if in_menu:
+                self.gen_q.put("TASK: Arena – Fight finished. Returning control.")
+                self.ctx.in_arena_fight = False
+                self.s = ArenaState.FIGHT_OVER
+                self.state = TaskState.DONE # Mark as done until reset
+                _send_key() # Final key press to dismiss the win/loss screen
+            else:
+                # Fight still ongoing, press key to continue
+                _send_key()
+        # If no "press any key" but kingdom menu appears, something went wrong, exit
+        elif in_menu:
+            self.gen_q.put("WARN: Arena – Kingdom menu detected unexpectedly during fight. Ending task.")
+            self.ctx.in_arena_fight = False
+            self.s = ArenaState.FIGHT_OVER
+            self.state = TaskState.DONE # Mark as done
+
+    def _h_fight_over(self, txt: str, low: str) -> None:
+        """FIGHT_OVER state doesn't need active handling in feed."""
+
+    @property
+    def needs_retick(self) -> bool:
+        # Each round screen may repeat verbatim, and a dropped key press leaves the
+        # same screen up, so every tick of a fight gets another press
+        return self.s is ArenaState.FIGHTING
 
     def reset(self) -> None:
         """Reset the task to wait for the next fight."""
@@ -380,55 +518,90 @@ class ArenaTask(Task):
 class CoreAgent:
     """Feeds console buffers to the first *active* internal task."""
 
+    __slots__ = (
+        "ctx", "mem", "gen_q", "_log", "boot_task", "save_task", "arena_task", "tasks",
+        "_active_idx", "_last_frame",
+    )
+
     def __init__(self, memory: MemoryManager, gen_q: queue.Queue, save_name: str = "LLMSave"):
         self.ctx = AgentContext(save_name)
         self.mem = memory
         self.gen_q = gen_q
-        self.tasks: List[Task] = []
+        # Tasks and the agent log here; feed() hands a tick's worth to gen_q in one put
+        self._log = _TickLog(gen_q)
+        self.boot_task = BootTask(self.ctx, memory, self._log)
+        self.save_task = SaveTask(self.ctx, memory, self._log)
+        self.arena_task = ArenaTask(self.ctx, memory, self._log)
         # Order matters for priority: Boot > Save > Arena
-        self.tasks.append(BootTask(self.ctx, memory, gen_q))
-        self.tasks.append(SaveTask(self.ctx, memory, gen_q))
-        self.tasks.append(ArenaTask(self.ctx, memory, gen_q)) # Add ArenaTask
-        self.gen_q.put("AGENT: CoreAgent initialized.")
+        self.tasks: List[Task] = [self.boot_task, self.save_task, self.arena_task]
+        # Index of the first task that has not finished for good. Only BootTask ever
+        # finishes permanently, so this moves from 0 to 1 once and never back.
+        self._active_idx = 0
+        # (buffer hash, save pending) of the last frame processed; see feed()
+        self._last_frame: tuple[int, bool] | None = None
+        self._log.put("AGENT: CoreAgent initialized.")
+        self._log.flush()
 
     # ── public API ──
     def feed(self, buf: str) -> None:
+        # --- Skip Unchanged Frames ---
+        # Tasks mostly react to new screens, except SaveTask whose trigger is a flag that
+        # can flip while the screen stays put, so the pending-save state is part of the key.
+        # Tasks that retry on an unchanged screen say so through needs_retick.
+        frame = (hash(buf), self.ctx.needs_save or self.mem.request_save)
+        if frame == self._last_frame and not any(task.needs_retick for task in self.tasks):
+            return
+        self._last_frame = frame
+        try:
+            self._process(buf)
+        finally:
+            self._log.flush()
+
+    def _process(self, buf: str) -> None:
+        """Run one new frame through the tasks; messages go to ``self._log``."""
+        low = buf.casefold()  # shared by every task this tick
+
         # --- Update Kingdom Menu Flag ---
-        in_menu = bool(pat.KINGDOM_MENU_RE.search(buf))
+        in_menu = pat.KINGDOM_MENU_HINT in low
         if in_menu != self.ctx.in_kingdom_menu:
             self.ctx.in_kingdom_menu = in_menu
             status = "Entered" if in_menu else "Exited"
             if not self.ctx.in_arena_fight: # Avoid logging menu exit during fight end
-                self.gen_q.put(f"AGENT: {status} Kingdom Menu.")
+                self._log.put(f"AGENT: {status} Kingdom Menu.")
 
         # --- Task Reset Logic ---
         # Reset SaveTask if it finished and a new save is needed
-        save_task = next((t for t in self.tasks if isinstance(t, SaveTask)), None)
-        if save_task and save_task.state is TaskState.DONE and self.ctx.needs_save:
+        save_task = self.save_task
+        if save_task.state is TaskState.DONE and self.ctx.needs_save:
             save_task.reset()
 
         # Reset ArenaTask if it finished
-        arena_task = next((t for t in self.tasks if isinstance(t, ArenaTask)), None)
-        if arena_task and arena_task.state is TaskState.DONE:
+        arena_task = self.arena_task
+        if arena_task.state is TaskState.DONE:
             arena_task.reset() # Reset puts it back to WAITING state
 
         # --- Task Feeding Logic (Priority Order) ---
         processed = False
-        # 1. BootTask (Highest priority)
-        boot_task = next((t for t in self.tasks if isinstance(t, BootTask)), None)
-        if boot_task and boot_task.state is TaskState.ACTIVE:
-            boot_task.feed(buf)
+        # 1. BootTask (Highest priority) – skipped once it is done
+        if self._active_idx == 0:
+            boot_task = self.boot_task
+            if self._triggered(boot_task, low):
+                boot_task.feed(buf, low)
+            if boot_task.state is TaskState.DONE:
+                self._active_idx = 1
             processed = True
 
         # 2. SaveTask (If active and needed)
-        if not processed and save_task and save_task.state is TaskState.ACTIVE and self.ctx.needs_save:
+        if not processed and save_task.state is TaskState.ACTIVE and self.ctx.needs_save:
              # SaveTask internally checks if it should run based on menu state + needs_save
-             save_task.feed(buf)
+             if self._triggered(save_task, low):
+                 save_task.feed(buf, low)
              # We don't set processed=True here, as SaveTask might just be waiting for the menu
 
         # 3. ArenaTask (If waiting or active)
-        if not processed and arena_task and arena_task.state in (TaskState.WAITING, TaskState.ACTIVE):
-            arena_task.feed(buf)
+        if not processed and arena_task.state in (TaskState.WAITING, TaskState.ACTIVE):
+            if self._triggered(arena_task, low):
+                arena_task.feed(buf, low)
             # If ArenaTask became active or was already active, it processed the buffer
             if arena_task.state is TaskState.ACTIVE:
                  processed = True
@@ -436,10 +609,16 @@ class CoreAgent:
         # If no priority task handled the buffer, it might be for the LLM later
         # (LLM interaction is handled in the main runner loop based on ready_for_llm)
 
+    @staticmethod
+    def _triggered(task: Task, low: str) -> bool:
+        """Cheap prefilter: False when the task's awaited prompt is not on screen."""
+        trigger = task.trigger()
+        return trigger is None or trigger in low
+
     @property
     def ready_for_llm(self) -> bool:
         """True once BootTask is DONE, not in an arena fight, and game is at free‑play."""
-        boot_done = any(isinstance(t, BootTask) and t.state is TaskState.DONE for t in self.tasks)
+        boot_done = self.boot_task.state is TaskState.DONE
         arena_active = self.ctx.in_arena_fight # Use the context flag
 
         # LLM is ready only if boot is done AND we are not in an arena fight
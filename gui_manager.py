@@ -8,12 +8,19 @@ from __future__ import annotations
 
 import logging
 import queue
+import threading
 import tkinter as tk
+import tkinter.font as tkfont
+from collections import deque
+from contextlib import contextmanager
+from itertools import islice
 from tkinter.scrolledtext import ScrolledText
-from typing import Final, Tuple, List
+from typing import Deque, Dict, Final, Generic, Iterator, List, Optional, Tuple, TypeVar
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Dark mode theme colors
 DARK_BG = "#2b2b2b"
 LIGHT_FG = "#dcdcdc"
@@ -28,20 +35,103 @@ DEFAULT_FONT_FAMILY = "Segoe UI"
 LLM_FONT_SIZE = 12
 GENERAL_FONT_SIZE = 11
 LABEL_FONT_SIZE = 10
+# Named Tk fonts, created once by GuiManager and referenced by name everywhere else
+LLM_FONT = "WarsimLLM"
+LLM_BOLD_FONT = "WarsimLLMBold"
+GENERAL_FONT = "WarsimGeneral"
+LABEL_FONT = "WarsimLabel"
+NAMED_FONTS: Tuple[Tuple[str, int, str], ...] = (  # (name, size, weight)
+    (LLM_FONT, LLM_FONT_SIZE, "normal"),
+    (LLM_BOLD_FONT, LLM_FONT_SIZE, "bold"),
+    (GENERAL_FONT, GENERAL_FONT_SIZE, "normal"),
+    (LABEL_FONT, LABEL_FONT_SIZE, "bold"),
+)
+# Lines kept per turn in the LLM pane; older lines of a runaway turn are dropped
+MAX_LLM_LINES_PER_TURN = 2000
+# Lines kept in the general log pane; trimmed back once it overshoots by the slack
+MAX_GENERAL_LINES = 5000
+GENERAL_TRIM_SLACK = 500
+# Text tag styles as (name, tag_config options)
+TagSpecs = Tuple[Tuple[str, Dict[str, object]], ...]
+DEFAULT_TAG_SPECS: TagSpecs = (("default", {"foreground": LIGHT_FG}),)
+LLM_TAG_SPECS: TagSpecs = (
+    ("reasoning", {"foreground": ACCENT_BLUE}),
+    ("action", {"foreground": ACCENT_ORANGE, "font": LLM_BOLD_FONT}),
+    ("action_warning", {"foreground": ACCENT_YELLOW, "font": LLM_BOLD_FONT}),
+    ("warning", {"foreground": ACCENT_YELLOW}),
+    ("error", {"foreground": ACCENT_RED, "font": LLM_BOLD_FONT}),
+    *DEFAULT_TAG_SPECS,
+    ("previous_turn_style", {"foreground": PREVIOUS_TURN_DIM}),
+)
+# One shared tags tuple per known LLM tag, so messages are tagged without asking Tk or allocating
+LLM_TAG_TUPLES: Dict[str, Tuple[str]] = {name: (name,) for name, _options in LLM_TAG_SPECS}
+DEFAULT_TAGS = LLM_TAG_TUPLES["default"]
+ERROR_TAGS = LLM_TAG_TUPLES["error"]
+PREVIOUS_TURN_TAGS = LLM_TAG_TUPLES["previous_turn_style"]
+# yview() bottom fraction at or above which a pane counts as following new output
+SCROLL_BOTTOM = 0.999
 # Placeholder text
 STRATEGIC_PLACEHOLDER = "(No strategic summary available yet)"
 
 
+def _take_all(q: queue.Queue) -> List:
+    """Remove and return everything currently in *q* under a single lock acquisition.
+
+    Reaches into ``queue.Queue`` internals (``mutex``, ``queue``, ``not_full``), the
+    same state ``get()`` updates under the same lock. Safe for the GUI feeds because
+    they are plain FIFO queues, unbounded (so no producer ever waits on ``not_full``;
+    the notify only keeps a bounded queue correct), and nobody calls ``join()`` or
+    ``task_done()`` on them, so leaving ``unfinished_tasks`` alone is harmless.
+    """
+    with q.mutex:
+        items = list(q.queue)
+        q.queue.clear()
+        q.not_full.notify_all()
+    return items
+
+
+class LatestSlot(Generic[T]):
+    """Single-value mailbox for feeds where only the newest item matters.
+
+    Offers ``put``/``put_nowait`` so ``queue.Queue`` producers work unchanged; a put
+    overwrites any value the GUI has not taken yet.
+    """
+
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self) -> None:
+        self._value: Optional[T] = None
+        self._lock = threading.Lock()
+
+    def put(self, item: T, block: bool = True, timeout: Optional[float] = None) -> None:
+        with self._lock:
+            self._value = item
+
+    def put_nowait(self, item: T) -> None:
+        self.put(item)
+
+    def take(self) -> Optional[T]:
+        """Return the latest value (None if nothing new) and empty the slot."""
+        with self._lock:
+            value, self._value = self._value, None
+        return value
+
+
 class GuiManager:
     """Run Tkinter main‑loop and drain three queues into three panes."""
 
+    # Idle poll interval. Producers never call into Tk (Tk objects belong to this
+    # thread, and cross-thread calls block the caller until Tk services them), so
+    # polling is the only way the GUI learns about new items.
     POLL_MS: Final[int] = 100
+    # Poll cadence right after activity; it doubles back to POLL_MS while idle
+    ACTIVE_POLL_MS: Final[int] = 20
 
     def __init__(
         self,
         llm_q: queue.Queue[Tuple[str, str]],
         general_q: queue.Queue[str],
-        strategic_q: queue.Queue[str] # Add strategic queue
+        strategic_q: queue.Queue[str] | LatestSlot[str] # Add strategic queue
     ) -> None:
         """Initialize GUI with three queue inputs.
 
@@ -56,11 +146,19 @@ class GuiManager:
 
         # --- State for LLM Pane Turn Display ---
         self.current_turn_number: int = 0
-        self.current_llm_lines: List[Tuple[str, Tuple[str, ...]]] = []
-        self.previous_llm_lines: List[Tuple[str, Tuple[str, ...]]] = []
+        self.current_llm_lines: Deque[Tuple[str, Tuple[str, ...]]] = deque(maxlen=MAX_LLM_LINES_PER_TURN)
+        self.previous_llm_lines: Deque[Tuple[str, Tuple[str, ...]]] = deque(maxlen=MAX_LLM_LINES_PER_TURN)
+        self._llm_clip_warned: bool = False  # cap warning is logged once per session
+        # Turn header lines, rebuilt only when the turn advances
+        self._previous_header: str = ""
+        self._current_header: str = self._turn_header(self.current_turn_number)
         # ---------------------------------------
-        self._llm_pane_needs_redraw: bool = False # Add redraw flag
+        self._llm_pane_needs_redraw: bool = False # Full redraw needed (turn shift)
+        self._llm_rendered: int = 0  # current_llm_lines already shown in the LLM pane
         self._pending_turn_number: int = 0  # New: track pending turn advance
+        self._poll_interval: int = self.POLL_MS  # delay before the next poll
+        self._strategic_current_text: str = STRATEGIC_PLACEHOLDER  # what the strategic pane shows
+        self._general_line_count: int = 0  # lines currently in the general log pane
 
         self.root = tk.Tk()
         self.root.title(f"Warsim Automation Diagnostics - Turn {self.current_turn_number}")
@@ -70,6 +168,11 @@ class GuiManager:
         self.root.grid_rowconfigure(1, weight=2) # Strategic pane
         self.root.grid_rowconfigure(2, weight=3) # General pane (larger weight)
         self.root.grid_columnconfigure(0, weight=1)
+        # Keep the handles: a named Font deletes its Tk font when garbage-collected
+        self._fonts = [
+            tkfont.Font(self.root, name=name, family=DEFAULT_FONT_FAMILY, size=size, weight=weight)
+            for name, size, weight in NAMED_FONTS
+        ]
 
         # --- Setup UI Panes --- 
         self._setup_llm_pane()
@@ -80,7 +183,7 @@ class GuiManager:
 
     # --- Generic UI Creation Helper ---
 
-    def _create_text_pane(self, parent: tk.Misc, row: int, title: str, font: tuple, pady: Tuple[int, int]) -> ScrolledText:
+    def _create_text_pane(self, parent: tk.Misc, row: int, title: str, font: str, pady: Tuple[int, int]) -> ScrolledText:
         """Creates a standard pane containing a title label and a ScrolledText widget."""
         frame = tk.Frame(parent, bg=DARK_BG)
         frame.grid(row=row, column=0, sticky="nsew", padx=4, pady=pady)
@@ -90,7 +193,7 @@ class GuiManager:
         tk.Label(
             frame,
             text=title,
-            font=(DEFAULT_FONT_FAMILY, LABEL_FONT_SIZE, "bold"),
+            font=LABEL_FONT,
             bg=DARK_BG, fg=LIGHT_FG
         ).grid(row=0, column=0, sticky="w")
 
@@ -99,11 +202,19 @@ class GuiManager:
             state="disabled",
             font=font,
             wrap=tk.WORD,
+            # Output-only panes: never record inserts/deletes for undo
+            undo=False, autoseparators=False, maxundo=0,
             bg="#3c3f41", fg=LIGHT_FG, insertbackground=LIGHT_FG
         )
         text_widget.grid(row=1, column=0, sticky="nsew")
         return text_widget
 
+    @staticmethod
+    def _apply_tags(widget: ScrolledText, specs: TagSpecs) -> None:
+        """Configures every (name, options) tag in *specs* on *widget*."""
+        for name, options in specs:
+            widget.tag_config(name, **options)
+
     # --- Specific Pane Setup Helpers (called by __init__) ---
 
     def _setup_llm_pane(self) -> None:
@@ -112,18 +223,12 @@ class GuiManager:
             parent=self.root,
             row=0,
             title="LLM Reasoning / Actions",
-            font=(DEFAULT_FONT_FAMILY, LLM_FONT_SIZE),
+            font=LLM_FONT,
             pady=(3, 1)
         )
 
         # Define text tags
-        self.llm_txt.tag_config("reasoning", foreground=ACCENT_BLUE)
-        self.llm_txt.tag_config("action", foreground=ACCENT_ORANGE, font=(DEFAULT_FONT_FAMILY, LLM_FONT_SIZE, "bold"))
-        self.llm_txt.tag_config("action_warning", foreground=ACCENT_YELLOW, font=(DEFAULT_FONT_FAMILY, LLM_FONT_SIZE, "bold"))
-        self.llm_txt.tag_config("warning", foreground=ACCENT_YELLOW)
-        self.llm_txt.tag_config("error", foreground=ACCENT_RED, font=(DEFAULT_FONT_FAMILY, LLM_FONT_SIZE, "bold"))
-        self.llm_txt.tag_config("default", foreground=LIGHT_FG)
-        self.llm_txt.tag_config("previous_turn_style", foreground=PREVIOUS_TURN_DIM)
+        self._apply_tags(self.llm_txt, LLM_TAG_SPECS)
 
         # Initial content
         self._redraw_llm_pane()
@@ -134,17 +239,16 @@ class GuiManager:
             parent=self.root,
             row=1,
             title="Strategic Overview",
-            font=(DEFAULT_FONT_FAMILY, GENERAL_FONT_SIZE), # Use fixed general font size
+            font=GENERAL_FONT, # Use fixed general font size
             pady=(1, 1)
         )
 
         # Define default tag
-        self.strategic_txt.tag_config("default", foreground=LIGHT_FG)
+        self._apply_tags(self.strategic_txt, DEFAULT_TAG_SPECS)
 
         # Set initial placeholder text
-        self.strategic_txt.configure(state="normal")
-        self.strategic_txt.insert("1.0", STRATEGIC_PLACEHOLDER, ("default",))
-        self.strategic_txt.configure(state="disabled")
+        with self._editable(self.strategic_txt):
+            self.strategic_txt.insert("1.0", STRATEGIC_PLACEHOLDER, DEFAULT_TAGS)
 
     def _setup_general_pane(self) -> None:
         """Creates and configures the general logs pane."""
@@ -152,164 +256,195 @@ class GuiManager:
             parent=self.root,
             row=2,
             title="General Logs",
-            font=(DEFAULT_FONT_FAMILY, GENERAL_FONT_SIZE),
+            font=GENERAL_FONT,
             pady=(1, 3)
         )
 
         # Define default tag
-        self.gen_txt.tag_config("default", foreground=LIGHT_FG)
+        self._apply_tags(self.gen_txt, DEFAULT_TAG_SPECS)
 
     # --- Queue Processing --- 
 
     def _poll_queues(self) -> None:
-        """Poll all queues and schedule next polling."""
-        # Reset flag before draining - might be set by new messages
+        """Drain all queues and schedule the next poll, sooner while busy."""
+        if self._drain_queues():
+            self._poll_interval = self.ACTIVE_POLL_MS
+        else:
+            self._poll_interval = min(self._poll_interval * 2, self.POLL_MS)
+        self.root.after(self._poll_interval, self._poll_queues)
+
+    def _drain_queues(self) -> bool:
+        """Drain all queues into their panes; True if anything arrived."""
+        # Reset flag before draining - might be set by a turn shift
         self._llm_pane_needs_redraw = False
 
         # --- Drain queues ---
-        # State shift logic is now inside _drain for llm_q
-        self._drain(self.llm_q, self.llm_txt)
-        self._drain(self.general_q, self.gen_txt) # Reads TURN msg, sets _pending_turn_number
-        self._drain_strategic_queue()
+        # State shift logic is now inside _drain_llm
+        received = self._drain_llm()
+        received |= self._drain_general() # Reads TURN msg, sets _pending_turn_number
+        received |= self._drain_strategic_queue()
 
-        # Redraw LLM pane if needed (flag set by _drain if messages arrived or state shifted)
+        # Redraw LLM pane after a turn shift; otherwise just append what arrived
         if self._llm_pane_needs_redraw:
              self._redraw_llm_pane()
+        elif len(self.current_llm_lines) > self._llm_rendered:
+             self._append_llm_lines()
 
         # ---- Pending turn advance logic moved ----
-
-        self.root.after(self.POLL_MS, self._poll_queues)
-
-    def _drain(
-        self,
-        q: queue.Queue[str] | queue.Queue[Tuple[str, str]],
-        widget: ScrolledText
-    ) -> None:
-        """Drain messages from queue and display in widget. Handles turn logic for LLM pane."""
-        is_llm_widget = (widget == self.llm_txt)
-        is_gen_widget = (widget == self.gen_txt)
-
-        try:
-            while True:
-                item = q.get_nowait()
-                # --- Centralized TURN Message Handling (only for general queue) ---
-                if is_gen_widget and isinstance(item, str) and item.startswith("TURN: "):
-                    try:
-                        new_turn_number = int(item.split(":", 1)[1].strip())
-                        # Only set pending flag if it's actually a new turn number
-                        if new_turn_number > self.current_turn_number:
-                             self._pending_turn_number = new_turn_number
-                        continue # Consume the TURN message and get next item
-                    except (ValueError, IndexError) as e:
-                        logger.warning("GUI: Could not parse turn update message: '%s', Error: %s. Treating as regular message.", item, e)
-                        # Fall through to process as a regular message if parsing failed
-
-                # --- Dispatch to Specific Handlers --- 
-                # --- Process LLM messages --- 
-                if is_llm_widget and isinstance(item, tuple) and len(item) == 2:
-                    self._handle_llm_message(item, widget)
-                # --- Process General Log messages (that are NOT the TURN message) --- 
-                elif is_gen_widget and isinstance(item, str):
-                    self._handle_general_message(item, widget)
-                # --- Handle unexpected item types --- 
-                else:
-                    # Handle items that don't match expected types for either queue
-                    if is_llm_widget: # Unexpected item for LLM pane
-                        logger.warning("GUI: Received unexpected item type '%s' for LLM pane: %s", type(item), item)
-                        text_to_store = str(item)
-                        # Attempt to advance turn state before adding error msg
-                        self._advance_turn_state_if_pending()
-                        # this bypasses the turn-based storage in current_llm_lines
-                        self._update_text_widget(widget, f"ERROR: Unexpected LLM Queue Item: {text_to_store}", tags=("error",))
-                    elif is_gen_widget: # Unexpected item for General pane
-                         logger.warning("GUI: Received unexpected item type '%s' for General pane: %s", type(item), item)
-                         self._update_text_widget(widget, str(item), tags=("error",))
-                    else: # Should not happen
-                         logger.error("GUI: Item '%s' received for unknown widget '%s'", item, widget.winfo_name())
-
-        except queue.Empty:
-            pass # No messages in the queue
-
-    # --- Message Handling Helpers (called by _drain) --- 
+        return received
+
+    def _drain_llm(self) -> bool:
+        """Drain (msg_type, msg) pairs from the LLM queue; True if any arrived."""
+        items = _take_all(self.llm_q)
+        for item in items:
+            # Only real pairs: unpacking alone would also accept "ab" or [type, msg]
+            if isinstance(item, tuple) and len(item) == 2:
+                self._handle_llm_message(*item)
+            else: # Unexpected item for LLM pane
+                logger.warning("GUI: Received unexpected item type '%s' for LLM pane: %s", type(item), item)
+                text_to_store = str(item)
+                # Attempt to advance turn state before adding error msg
+                self._advance_turn_state_if_pending()
+                # this bypasses the turn-based storage in current_llm_lines
+                self._update_text_widget(self.llm_txt, f"ERROR: Unexpected LLM Queue Item: {text_to_store}", tags=ERROR_TAGS)
+        return bool(items)
+
+    def _drain_general(self) -> bool:
+        """Drain the general log queue into its pane; True if any arrived. Consumes TURN messages."""
+        # Lines collected this drain, inserted with one Tk call at the end
+        pending: List[Tuple[str, Tuple[str, ...]]] = []
+        items = _take_all(self.general_q)
+
+        for item in items:
+            try:
+                is_turn = item.startswith("TURN: ")
+            except (AttributeError, TypeError): # Unexpected item for General pane (bytes raise TypeError)
+                logger.warning("GUI: Received unexpected item type '%s' for General pane: %s", type(item), item)
+                pending.append((str(item), ERROR_TAGS))
+                continue
+            # --- Centralized TURN Message Handling ---
+            if is_turn:
+                try:
+                    new_turn_number = int(item[6:])  # after "TURN: "; int() ignores surrounding whitespace
+                    # Only set pending flag if it's actually a new turn number
+                    if new_turn_number > self.current_turn_number:
+                         self._pending_turn_number = new_turn_number
+                    continue # Consume the TURN message and get next item
+                except ValueError as e:
+                    logger.warning("GUI: Could not parse turn update message: '%s', Error: %s. Treating as regular message.", item, e)
+                    # Fall through to process as a regular message if parsing failed
+            pending.append((item, ()))
+
+        if pending:
+            self._append_lines(self.gen_txt, pending)
+            self._general_line_count += sum(text.count("\n") + 1 for text, _tags in pending)
+            if self._general_line_count > MAX_GENERAL_LINES + GENERAL_TRIM_SLACK:
+                self._trim_general_pane()
+        return bool(items)
+
+    def _trim_general_pane(self) -> None:
+        """Drops the oldest general log lines so the pane holds MAX_GENERAL_LINES."""
+        excess = self._general_line_count - MAX_GENERAL_LINES
+        with self._editable(self.gen_txt):
+            self.gen_txt.delete("1.0", f"{excess + 1}.0")
+        self._general_line_count = MAX_GENERAL_LINES
+
+    # --- Message Handling Helpers (called by _drain_llm) --- 
 
     def _advance_turn_state_if_pending(self) -> None:
         """Checks if a turn advance is pending and performs the state shift."""
         if self._pending_turn_number > self.current_turn_number:
              # Perform LLM state shift
-            self.previous_llm_lines = self.current_llm_lines[:] # Make a copy
-            self.current_llm_lines.clear()
+            self.previous_llm_lines = self.current_llm_lines # Hand over, no copy
+            self.current_llm_lines = deque(maxlen=MAX_LLM_LINES_PER_TURN)
             self.current_turn_number = self._pending_turn_number
             self._pending_turn_number = 0 # Reset pending flag
+            self._previous_header = self._turn_header(self.current_turn_number - 1)
+            self._current_header = self._turn_header(self.current_turn_number)
             # Update title now that state has advanced
             self.root.title(f"Warsim Automation Diagnostics - Turn {self.current_turn_number}")
             self._llm_pane_needs_redraw = True # Set flag: redraw needed after shift
 
-    def _handle_llm_message(self, item: Tuple[str, str], widget: ScrolledText) -> None:
+    @staticmethod
+    def _turn_header(turn: int) -> str:
+        """Returns the header line shown above a turn's LLM lines."""
+        return f"------ Turn {turn} ------\n"
+
+    def _handle_llm_message(self, msg_type: str, msg: str) -> None:
         """Processes a message from the LLM queue."""
         # Advance turn state *before* adding the new message if pending
         self._advance_turn_state_if_pending()
 
-        # Add message to current turn's data
-        msg_type, msg = item
-        # Check if tag exists before using it
-        tag_exists = widget.tag_cget(msg_type, "foreground")
-        tags = (msg_type,) if tag_exists else ("default",)
+        # Add message to current turn's data; unknown types fall back to the default tag
+        tags = LLM_TAG_TUPLES.get(msg_type, DEFAULT_TAGS)
 
+        if len(self.current_llm_lines) == MAX_LLM_LINES_PER_TURN:
+            if not self._llm_clip_warned:
+                logger.warning("GUI: LLM pane capped at %d lines per turn; dropping oldest lines.", MAX_LLM_LINES_PER_TURN)
+                self._llm_clip_warned = True
+            self._llm_pane_needs_redraw = True # Oldest line leaves the pane too
         self.current_llm_lines.append((msg, tags))
-        self._llm_pane_needs_redraw = True # Set flag: redraw needed
-
-    def _handle_general_message(self, item: str, widget: ScrolledText) -> None:
-        """Processes a message from the general queue, handling TURN updates."""
-        # NOTE: TURN message check is now handled in _drain.
-        self._update_text_widget(widget, item)
 
     # --- LLM Pane Redrawing --- 
     def _redraw_llm_pane(self) -> None:
         """Clears and redraws the LLM pane with previous (dimmed) and current turn data."""
-        self.llm_txt.configure(state="normal")
-        self.llm_txt.delete("1.0", "end") # Clear the entire widget
+        # Whole pane is built as (chars, tags, chars, tags, ...) and inserted in one call
+        chunks: List[object] = []
 
-        # --- Insert Previous Turn ---
+        # --- Previous Turn ---
         if self.current_turn_number > 0 and self.previous_llm_lines:
-            prev_turn_num = self.current_turn_number - 1
-            # Insert header for previous turn, dimmed
-            self.llm_txt.insert("end", f"------ Turn {prev_turn_num} ------\n", ("previous_turn_style",))
-            # Insert previous turn lines, all using the dimmed style
-            for msg, _original_tags in self.previous_llm_lines:
-                 self.llm_txt.insert("end", msg + "\n", ("previous_turn_style",))
-            self.llm_txt.insert("end", "\n") # Add a blank line separation
-
-        # --- Insert Current Turn ---
-        # Insert header for current turn, default style
-        self.llm_txt.insert("end", f"------ Turn {self.current_turn_number} ------\n", ("default",))
-        # Insert current turn lines using their original semantic tags
+            # Header, lines and blank separator share the dimmed style, so they are one chunk
+            prev_lines = "".join(msg + "\n" for msg, _original_tags in self.previous_llm_lines)
+            chunks += (f"{self._previous_header}{prev_lines}\n", PREVIOUS_TURN_TAGS)
+
+        # --- Current Turn ---
+        # Header for current turn, default style
+        chunks += (self._current_header, DEFAULT_TAGS)
+        # Current turn lines keep their original semantic tags
         if self.current_llm_lines:
             for msg, original_tags in self.current_llm_lines:
-                self.llm_txt.insert("end", msg + "\n", original_tags)
+                chunks += (msg + "\n", original_tags)
         else:
              # Optionally, add a placeholder if no messages yet for the current turn
-             self.llm_txt.insert("end", "(No LLM activity yet for this turn)\n", ("default",))
-
-        # Make sure font is reset to default after potential error messages
-        self.llm_txt.configure(font=(DEFAULT_FONT_FAMILY, 12))
-        self.llm_txt.configure(state="disabled")
-        self.llm_txt.yview("end") # Ensure scrolled to the bottom
-
-    def _drain_strategic_queue(self) -> None:
-        """Drain the strategic summary queue and update the middle panel."""
+             chunks += ("(No LLM activity yet for this turn)\n", DEFAULT_TAGS)
+
+        first, last = self.llm_txt.yview()
+        with self._editable(self.llm_txt):
+            self.llm_txt.delete("1.0", "end") # Clear the entire widget
+            self.llm_txt.insert("end", *chunks)
+        if last >= SCROLL_BOTTOM:
+            self.llm_txt.yview("end") # Follow new output
+        else:
+            self.llm_txt.yview_moveto(first) # Reader scrolled up: keep their place
+        self._llm_rendered = len(self.current_llm_lines)
+
+    def _append_llm_lines(self) -> None:
+        """Append current-turn lines that are not in the LLM pane yet."""
+        if not self._llm_rendered:
+            self._redraw_llm_pane()  # first line of the turn replaces the placeholder
+            return
+        self._append_lines(self.llm_txt, list(islice(self.current_llm_lines, self._llm_rendered, None)))
+        self._llm_rendered = len(self.current_llm_lines)
+
+    def _drain_strategic_queue(self) -> bool:
+        """Drain the strategic summary queue and update the middle panel; True if one arrived."""
         latest_summary: str | None = None
         found_new = False
-        try:
-            while True:
-                latest_summary = self.strategic_q.get_nowait()
+        if isinstance(self.strategic_q, LatestSlot):
+            # Producer already dropped superseded summaries
+            latest_summary = self.strategic_q.take()
+            found_new = latest_summary is not None
+        else:
+            summaries = _take_all(self.strategic_q)
+            if summaries:
+                latest_summary = summaries[-1] # Older ones are superseded
                 found_new = True # Track if we actually got something
-        except queue.Empty:
-            pass # No new summaries
 
         # Update only if we actually received a summary from the queue this cycle
         if found_new and latest_summary is not None:
              # Simply update with the latest summary
              self._update_strategic_summary(latest_summary)
+        return found_new
 
     def _update_strategic_summary(self, summary: str) -> None:
         """Update the strategic summary text."""
@@ -317,18 +452,41 @@ class GuiManager:
         # Use placeholder if summary is empty or whitespace
         display_text = summary.strip() if summary and summary.strip() else STRATEGIC_PLACEHOLDER
 
-        # Simply update the text widget - no content comparison needed
+        # Compare with what we last wrote rather than reading the text back out of Tk
+        if display_text == self._strategic_current_text:
+            return
         self._update_text_widget(widget, display_text, replace=True)
+        self._strategic_current_text = display_text
 
     def start(self) -> None:
         """Start the Tkinter main loop."""
         self.root.mainloop()
 
+    @staticmethod
+    @contextmanager
+    def _editable(widget: ScrolledText) -> Iterator[ScrolledText]:
+        """Unlocks a read-only pane for one batch of edits and always locks it again."""
+        widget.configure(state="normal")
+        try:
+            yield widget
+        finally:
+            widget.configure(state="disabled")
+
+    def _append_lines(self, widget: ScrolledText, lines: List[Tuple[str, Tuple[str, ...]]]) -> None:
+        """Appends several (text, tags) lines with a single insert and one scroll."""
+        chunks: List[object] = []
+        for text, tags in lines:
+            chunks += (text + "\n", tags)
+        at_bottom = widget.yview()[1] >= SCROLL_BOTTOM
+        with self._editable(widget):
+            widget.insert("end", *chunks)
+        if at_bottom: # Only follow new output if the reader hasn't scrolled up
+            widget.yview("end")
+
     def _update_text_widget(self, widget: ScrolledText, text: str, tags: Tuple[str, ...] = (), replace: bool = False) -> None:
         """Updates the text in a ScrolledText widget with the specified text and tags."""
-        widget.configure(state="normal")
-        if replace:
-            widget.delete("1.0", "end")
-        widget.insert("end", text + "\n", tags)
-        widget.configure(state="disabled")
+        with self._editable(widget):
+            if replace:
+                widget.delete("1.0", "end")
+            widget.insert("end", text + "\n", tags)
         widget.yview("end")
@@ -5,6 +5,7 @@ import ctypes
 import logging
 import time
 from ctypes import wintypes
+from typing import Iterable
 
 
 # Initialize logger before any logging calls
@@ -182,6 +183,27 @@ def send_number(num: int, append_enter: bool = True) -> None:
     send_text(str(num), append_enter)
 
 
+def send_number_sequence(numbers: Iterable[int], inter_delay: float, append_enter: bool = True) -> None:
+    """Send several numbers with send_number, pausing between consecutive numbers.
+
+    Each number keeps send_text's per-character and Enter pacing; *inter_delay* is the
+    single extra pause between numbers that gives each menu time to come up.
+
+    Args:
+        numbers: Numbers to send, in order.
+        inter_delay: Seconds to sleep between consecutive numbers.
+        append_enter: Whether to append Enter key after each number.
+
+    Raises:
+        RuntimeError: If HWND is not initialized.
+        OSError: If PostMessageW fails.
+    """
+    for i, num in enumerate(numbers):
+        if i:
+            time.sleep(inter_delay)
+        send_number(num, append_enter)
+
+
 def send_input(cmd: str) -> None:
     """Send a command string followed by Enter.
 
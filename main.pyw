@@ -34,7 +34,7 @@ from google import genai
 # Local application imports
 from console_manager import ConsoleManager
 from core_agent import CoreAgent
-from gui_manager import GuiManager
+from gui_manager import GuiManager, LatestSlot
 import input_manager
 from llm_manager import LLMManager
 from memory_manager import MemoryManager
@@ -324,7 +324,7 @@ if __name__ == "__main__":
     # Create communication queues
     llm_q: queue.Queue[Tuple[str, str]] = queue.Queue() # Explicitly type hint
     general_q: queue.Queue[str] = queue.Queue()
-    strategic_q: queue.Queue[str] = queue.Queue() # Add strategic queue
+    strategic_q: LatestSlot[str] = LatestSlot() # Only the newest summary is ever shown
 
     # --- Initial Setup Logging (Send to General Queue) ---
     general_q.put("SYS: Initializing...") # Add initial message
@@ -8,13 +8,15 @@ from __future__ import annotations
 import json
 import collections # Add this import for deque
 from pathlib import Path
-from typing import List
-import queue # Add queue import
+from typing import TYPE_CHECKING, List
 
 from google import genai
 from google.genai import types
 import logging
 
+if TYPE_CHECKING:  # annotation only: importing gui_manager at runtime would pull in tkinter
+    from gui_manager import LatestSlot
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,7 +42,7 @@ class MemoryManager:
         models: List[str],
         save_name: str = "LLMSave",
         base_dir: str = "./saves",
-        strategic_q: queue.Queue[str] | None = None, # Add queue parameter
+        strategic_q: LatestSlot[str] | None = None, # Latest-value slot shown by the GUI
     ):
         """Initialize the memory manager.
 
@@ -49,7 +51,7 @@ class MemoryManager:
             models: List of model names to use for generation.
             save_name: Name for the save files.
             base_dir: Base directory for save files.
-            strategic_q: Optional queue to send strategic summaries to.
+            strategic_q: Optional slot to send strategic summaries to; only the newest is kept.
         """
         self.dir = Path(base_dir) / save_name
         self.dir.mkdir(parents=True, exist_ok=True)
@@ -57,7 +59,7 @@ class MemoryManager:
 
         self.client = client
         self.models = models
-        self._strategic_q = strategic_q # Store the queue
+        self._strategic_q = strategic_q # Store the slot
 
         # --- Load existing memory with error handling ---
         data = {}
@@ -268,12 +270,10 @@ class MemoryManager:
                 # Check for successful strategic summary generation
                 if new_strategic_summary != "(Summarization failed)":
                      self.strategic_summary = new_strategic_summary
-                     # Send to strategic queue if it exists
-                     if self._strategic_q:
-                          try:
-                               self._strategic_q.put_nowait(self.strategic_summary)
-                          except queue.Full:
-                               logger.warning("MemoryManager: Strategic summary queue is full. Discarding update.")
+                     # Send to the strategic slot if it exists
+                     if self._strategic_q is not None:
+                          # Never blocks or fills: an unshown older summary is simply replaced
+                          self._strategic_q.put_nowait(self.strategic_summary)
                 else:
                      logger.warning("MemoryManager: Strategic summary generation failed.")
                 # -----------------------------------------------------------------------------